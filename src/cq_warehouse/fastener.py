@@ -33,20 +33,62 @@ license:
 from warnings import warn
 from abc import ABC, abstractmethod
 from typing import Literal, Tuple, Optional, List
-from math import sin, cos, tan, radians, pi, degrees, sqrt
+from functools import cache
+from fractions import Fraction
+from collections import OrderedDict
+from math import sin, cos, tan, radians, pi, degrees, sqrt, hypot
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.reduction import ForkingPickler
 import csv
 import importlib.resources as pkg_resources
 import cadquery as cq
 from cadquery import Solid, Compound
+from cadquery.occ_impl.shapes import downcast
+from OCP.BRep import BRep_Builder
 from OCP.BRepBuilderAPI import BRepBuilderAPI_Copy
-from cq_warehouse.thread import is_safe, imperial_str_to_float, IsoThread
+from OCP.BRepTools import BRepTools
+from OCP.TopoDS import TopoDS_Shape
+from cq_warehouse.thread import (
+    is_safe,
+    imperial_str_to_float,
+    IsoThread,
+    store_recently_used,
+)
 import cq_warehouse
 
-# from functools import cache
-
 MM = 1
 IN = 25.4 * MM
 
+# Building a fastener is expensive so the shape of each unique fastener is stored
+# here, keyed by class and construction parameters. Instances are given a copy of
+# the stored shape such that each fastener remains a distinct object. Only the
+# most recently used FASTENER_CACHE_SIZE shapes are kept to bound memory use.
+FASTENER_CACHE_SIZE = 128
+_fastener_shapes = OrderedDict()
+
+
+def _get_fastener_shape(key: tuple):
+    """Return a cached fastener shape and mark it as the most recently used"""
+    _fastener_shapes.move_to_end(key)
+    return _fastener_shapes[key]
+
+
+def _set_fastener_shape(key: tuple, value):
+    """Cache a fastener shape, discarding the least recently used if full"""
+    store_recently_used(_fastener_shapes, key, value, FASTENER_CACHE_SIZE)
+
+
+# Frequently used positioning constants which needn't be rebuilt on every use
+_ORIGIN = cq.Vector(0, 0, 0)
+_Z_AXIS = cq.Vector(0, 0, 1)
+
+# Hexagon and square chamfers are at 15°, the lower end of the 15°-30° range
+_TAN_CHAMFER_ANGLE = tan(radians(15))
+
+# Pan head sides start at 5° from vertical
+_PAN_HEAD_SIDE_TANGENT = (-sin(radians(5)), cos(radians(5)))
+
 # ISO standards use single variable dimension labels which are used extensively
 # pylint: disable=invalid-name
 
@@ -56,8 +98,13 @@ def polygon_diagonal(width: float, num_sides: Optional[int] = 6) -> float:
     return width / cos(pi / num_sides)
 
 
+@cache
 def read_fastener_parameters_from_csv(filename: str) -> dict:
-    """Parse a csv parameter file into a dictionary of strings"""
+    """Parse a csv parameter file into a dictionary of strings
+
+    Each file is only read once; the returned dictionary is shared so it must
+    not be modified.
+    """
 
     parameters = {}
     with pkg_resources.open_text(cq_warehouse, filename) as csvfile:
@@ -71,42 +118,61 @@ def read_fastener_parameters_from_csv(filename: str) -> dict:
     return parameters
 
 
+# Imperial # sizes to diameters
+IMPERIAL_NUMBERED_SIZES = {
+    "#0000": 0.0210 * IN,
+    "#000": 0.0340 * IN,
+    "#00": 0.0470 * IN,
+    "#0": 0.0600 * IN,
+    "#1": 0.0730 * IN,
+    "#2": 0.0860 * IN,
+    "#3": 0.0990 * IN,
+    "#4": 0.1120 * IN,
+    "#5": 0.1250 * IN,
+    "#6": 0.1380 * IN,
+    "#8": 0.1640 * IN,
+    "#10": 0.1900 * IN,
+    "#12": 0.2160 * IN,
+}
+
+
+@cache
 def decode_imperial_size(size: str) -> Tuple[float, float]:
     """Extract the major diameter and pitch from an imperial size"""
 
-    # Imperial # sizes to diameters
-    imperial_numbered_sizes = {
-        "#0000": 0.0210 * IN,
-        "#000": 0.0340 * IN,
-        "#00": 0.0470 * IN,
-        "#0": 0.0600 * IN,
-        "#1": 0.0730 * IN,
-        "#2": 0.0860 * IN,
-        "#3": 0.0990 * IN,
-        "#4": 0.1120 * IN,
-        "#5": 0.1250 * IN,
-        "#6": 0.1380 * IN,
-        "#8": 0.1640 * IN,
-        "#10": 0.1900 * IN,
-        "#12": 0.2160 * IN,
-    }
-
     sizes = size.split("-")
     if size[0] == "#":
-        major_diameter = imperial_numbered_sizes[sizes[0]]
+        major_diameter = IMPERIAL_NUMBERED_SIZES[sizes[0]]
     else:
         major_diameter = imperial_str_to_float(sizes[0])
-    pitch = IN / (imperial_str_to_float(sizes[1]) / IN)
+    # The second field is the thread count per inch, a plain number
+    pitch = IN / float(sizes[1])
     return (major_diameter, pitch)
 
 
+@cache
+def decode_thread_size(thread_size: str) -> Tuple[float, float]:
+    """Extract the major diameter and pitch from a metric or imperial size"""
+
+    if thread_size[0] == "M":
+        (diameter, pitch) = thread_size.split("-")
+        result = (float(diameter[1:]), float(pitch))
+    else:
+        result = decode_imperial_size(thread_size)
+    return result
+
+
 def metric_str_to_float(measure: str) -> float:
     """Convert a metric measurement to a float value"""
 
     if is_safe(measure):
-        # pylint: disable=eval-used
-        # Before eval() is called the string, extracted from the csv file, is verified as safe
-        result = eval(measure)
+        # Parse decimals and fractions directly rather than evaluating the string
+        value = sum(Fraction(term) for term in measure.split())
+        # Whole numbers (e.g. counts of knurls or holes) remain integers
+        if "." in measure or "/" in measure:
+            result = float(value)
+        else:
+            result = int(value)
     else:
         result = measure
     return result
@@ -155,8 +221,42 @@ def isolate_fastener_type(target_fastener: str, fastener_data: dict) -> dict:
     return result
 
 
+def split_fastener_data(fastener_data: dict) -> dict:
+    """Split the fastener data 'type:value' strings into a dictionary per fastener type"""
+    result = {}
+    for size, parameters in fastener_data.items():
+        for type_dimension, value in parameters.items():
+            (fastener_name, dimension) = tuple(type_dimension.strip().split(":"))
+            if not value == "":
+                type_data = result.setdefault(fastener_name, {})
+                type_data.setdefault(size, {})[dimension] = value
+    return result
+
+
+def evaluate_fastener_data(fastener_data: dict) -> dict:
+    """Convert the fastener data into dimensions keyed by fastener type and size"""
+    return {
+        fastener_type: {
+            size: evaluate_parameter_dict(parameters, is_metric=size[0] == "M")
+            for size, parameters in type_data.items()
+        }
+        for fastener_type, type_data in split_fastener_data(fastener_data).items()
+    }
+
+
+@cache
+def _fastener_type_data(fastener_class: type) -> dict:
+    """Evaluate the fastener data of a class the first time it's needed"""
+    return evaluate_fastener_data(fastener_class.fastener_data)
+
+
+@cache
 def read_drill_sizes() -> dict:
-    """Read the drill size csv file and build a drill_size dictionary (Ah, the imperial system)"""
+    """Read the drill size csv file and build a drill_size dictionary (Ah, the imperial system)
+
+    The file is only read once; the returned dictionary is shared so it must not be
+    modified.
+    """
     drill_sizes = {}
     with pkg_resources.open_text(cq_warehouse, "drill_sizes.csv") as csvfile:
         reader = csv.DictReader(csvfile)
@@ -237,15 +337,28 @@ def cross_recess(size: str) -> Tuple[cq.Workplane, float]:
         m = widths[size]
     except KeyError as e:
         raise ValueError(f"{size} is an invalid cross size {widths}") from e
+    # Trace the whole cross in one pass instead of mirroring a quarter twice
+    # which requires the mirrored wires to be combined
+    (a, b) = (m / 2, m / 12)
     recess = (
         cq.Workplane("XY")
-        .moveTo(m / 2, 0)
-        .vLineTo(m / 12)
-        .hLineTo(m / 12)
-        .vLineTo(m / 2)
-        .hLineTo(0)
-        .mirrorX()
-        .mirrorY()
+        .polyline(
+            [
+                (a, -b),
+                (a, b),
+                (b, b),
+                (b, a),
+                (-b, a),
+                (-b, b),
+                (-a, b),
+                (-a, -b),
+                (-b, -b),
+                (-b, -a),
+                (b, -a),
+                (b, -b),
+            ]
+        )
+        .close()
     )
     vertices = recess.vertices(
         cq.selectors.BoxSelector((-m / 3, -m / 3, -m / 3), (m / 3, m / 3, m / 3))
@@ -262,6 +375,12 @@ def hex_recess(size: float) -> cq.Workplane:
     return cq.Workplane("XY").polygon(6, polygon_diagonal(size))
 
 
+# ISO 10664 hexalobular recess dimensions keyed by size, e.g. T20
+_hexalobular_recess_data = evaluate_parameter_dict_of_dict(
+    read_fastener_parameters_from_csv("iso10664def.csv")
+)
+
+
 def hexalobular_recess(size: str) -> Tuple[cq.Workplane, float]:
     """Plan of Hexalobular recess for screws
 
@@ -271,9 +390,7 @@ def hexalobular_recess(size: str) -> Tuple[cq.Workplane, float]:
     depth approximately 60% of maximum diameter
     """
     try:
-        screw_data = evaluate_parameter_dict_of_dict(
-            read_fastener_parameters_from_csv("iso10664def.csv")
-        )[size]
+        screw_data = _hexalobular_recess_data[size]
     except KeyError as e:
         raise ValueError(f"{size} is an invalid hexalobular size") from e
 
@@ -315,9 +432,8 @@ def hexalobular_recess(size: str) -> Tuple[cq.Workplane, float]:
     plan_edges = []
     for a in range(0, -360, -60):
         for e in one_sixth_plan:
-            plan_edges.append(e.rotate((0, 0, 0), (0, 0, 1), a))
+            plan_edges.append(e.rotate(_ORIGIN, _Z_AXIS, a))
     return (cq.Workplane(cq.Wire.assembleEdges(plan_edges)), 0.6 * A)
-    # return plan
 
 
 def slot_recess(width: float, length: float) -> cq.Workplane:
@@ -349,7 +465,7 @@ def select_by_size_fn(cls, size: str) -> dict:
     for fastener_class in cls.__subclasses__():
         for fastener_type in fastener_class.types():
             if size in fastener_class.sizes(fastener_type):
-                if fastener_class in type_dict.keys():
+                if fastener_class in type_dict:
                     type_dict[fastener_class].append(fastener_type)
                 else:
                     type_dict[fastener_class] = [fastener_type]
@@ -362,6 +478,89 @@ def method_exists(cls, method: str) -> bool:
     return hasattr(cls, method) and callable(getattr(cls, method))
 
 
+def _reduce_fastener(fastener):
+    """Serialize a fastener with its OCCT shape as BREP for transfer between processes"""
+    brep = BytesIO()
+    BRepTools.Write_s(fastener.wrapped, brep)
+    state = {k: v for k, v in fastener.__dict__.items() if k != "wrapped"}
+    return (_rebuild_fastener, (type(fastener), state, brep.getvalue()))
+
+
+def _rebuild_fastener(cls, state: dict, brep: bytes):
+    """Recreate a fastener serialized by _reduce_fastener"""
+    shape = TopoDS_Shape()
+    BRepTools.Read_s(shape, BytesIO(brep), BRep_Builder())
+    fastener = cls.__new__(cls)
+    fastener.__dict__.update(state)
+    fastener.wrapped = downcast(shape)
+    return fastener
+
+
+def _register_fastener_class(cls):
+    """Prepare a Nut, Screw or Washer derived class when it's defined"""
+    # Allow fasteners to be passed between processes
+    ForkingPickler.register(cls, _reduce_fastener)
+    if isinstance(cls.fastener_data, dict):
+        cls._fastener_types = set(
+            p.split(":")[0] for p in list(cls.fastener_data.values())[0].keys()
+        )
+
+
+def _make_fastener(fastener_class, parameters: dict):
+    """Create a single fastener - used by the worker processes of make_fasteners"""
+    return fastener_class(**parameters)
+
+
+def _copy_fastener(fastener):
+    """Create a distinct fastener with a copy of the given fastener's shape"""
+    fastener_copy = type(fastener).__new__(type(fastener))
+    # Like newly created fasteners, each copy gets its own nut/screw/washer data
+    fastener_copy.__dict__.update(
+        {k: dict(v) if isinstance(v, dict) else v for k, v in fastener.__dict__.items()}
+    )
+    fastener_copy.wrapped = downcast(BRepBuilderAPI_Copy(fastener.wrapped).Shape())
+    return fastener_copy
+
+
+def make_fasteners(
+    fasteners: List[Tuple[type, dict]], processes: Optional[int] = None
+) -> list:
+    """Create many fasteners in parallel
+
+    Each unique fastener is created once in a pool of worker processes and
+    returned to this process as a BREP serialized copy. Repeated requests for
+    the same fastener are given their own copy of its shape.
+
+    Args:
+        fasteners (List[Tuple[type, dict]]): fastener class and its parameters,
+            e.g. [(HexNut, {"size": "M6-1", "fastener_type": "iso4032"}), ...]
+        processes (int, optional): number of worker processes.
+            Defaults to os.cpu_count().
+
+    Returns:
+        list: fasteners in the same order as requested
+    """
+    keys = [
+        (fastener_class, tuple(sorted(parameters.items())))
+        for fastener_class, parameters in fasteners
+    ]
+    unique_fasteners = dict(zip(keys, fasteners))
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        created = dict(
+            zip(
+                unique_fasteners.keys(),
+                executor.map(_make_fastener, *zip(*unique_fasteners.values())),
+            )
+        )
+
+    result = []
+    used = set()
+    for key in keys:
+        result.append(created[key] if key not in used else _copy_fastener(created[key]))
+        used.add(key)
+    return result
+
+
 class Nut(ABC, Solid):
     """Parametric Nut
 
@@ -425,7 +624,7 @@ class Nut(ABC, Solid):
     def clearance_drill_sizes(self):
         """A dictionary of drill sizes for clearance holes"""
         try:
-            return self.clearance_hole_drill_sizes[self.thread_size.split("-")[0]]
+            return self.clearance_hole_drill_sizes[self.diameter_size]
         except KeyError as e:
             raise ValueError(
                 f"No clearance hole data for size {self.thread_size}"
@@ -435,7 +634,7 @@ class Nut(ABC, Solid):
     def clearance_hole_diameters(self):
         """A dictionary of drill diameters for clearance holes"""
         try:
-            return self.clearance_hole_data[self.thread_size.split("-")[0]]
+            return self.clearance_hole_data[self.diameter_size]
         except KeyError as e:
             raise ValueError(
                 f"No clearance hole data for size {self.thread_size}"
@@ -480,15 +679,20 @@ class Nut(ABC, Solid):
         """Which derived class created this nut"""
         return type(self).__name__
 
+    def __init_subclass__(cls, **kwargs):
+        """Register each derived class and record its fastener types when defined"""
+        super().__init_subclass__(**kwargs)
+        _register_fastener_class(cls)
+
     @classmethod
     def types(cls) -> List[str]:
         """Return a set of the nut types"""
-        return set(p.split(":")[0] for p in list(cls.fastener_data.values())[0].keys())
+        return set(cls._fastener_types)
 
     @classmethod
     def sizes(cls, fastener_type: str) -> List[str]:
         """Return a list of the nut sizes for the given type"""
-        return list(isolate_fastener_type(fastener_type, cls.fastener_data).keys())
+        return list(_fastener_type_data(cls).get(fastener_type, {}).keys())
 
     @property
     def nut_thickness(self):
@@ -498,10 +702,7 @@ class Nut(ABC, Solid):
     @property
     def nut_diameter(self):
         """Calculate the maximum diameter of the nut"""
-        vertices = cq.Workplane(self).vertices().vals()
-        radii = [
-            (cq.Vector(0, 0, v.Z) - cq.Vector(v.toTuple())).Length for v in vertices
-        ]
+        radii = [hypot(v.X, v.Y) for v in self.Vertices()]
         if len(radii) == 0:
             raise Exception(f"Invalid nut: {type(self).__name__},{self.__dict__}")
         return 2 * max(radii)
@@ -516,7 +717,6 @@ class Nut(ABC, Solid):
         """Screw only parameter"""
         return 0
 
-    # @cache
     def __init__(
         self,
         size: str,
@@ -532,18 +732,13 @@ class Nut(ABC, Solid):
                 f"{size_parts} invalid, must be formatted as size-pitch(-length) or size-TPI(-length) where length is optional"
             )
         self.thread_size = "-".join(size_parts[:2])
+        self.diameter_size = size_parts[0]
         if len(size_parts) == 3:
             self.length_size = size_parts[2]
         self.is_metric = self.thread_size[0] == "M"
-        if self.is_metric:
-            self.thread_diameter = float(size_parts[0][1:])
-            self.thread_pitch = float(size_parts[1])
-        else:
-            (self.thread_diameter, self.thread_pitch) = decode_imperial_size(
-                self.thread_size
-            )
+        (self.thread_diameter, self.thread_pitch) = decode_thread_size(self.thread_size)
 
-        if fastener_type not in self.types():
+        if fastener_type not in self._fastener_types:
             raise ValueError(f"{fastener_type} invalid, must be one of {self.types()}")
         self.fastener_type = fastener_type
         if hand in ["left", "right"]:
@@ -553,71 +748,35 @@ class Nut(ABC, Solid):
         self.simple = simple
         self.socket_clearance = 6 * MM  # Used as extra clearance when countersinking
         try:
-            self.nut_data = evaluate_parameter_dict(
-                # isolate_fastener_type(self.fastener_type, self.fastener_data)[
-                #     self.thread_size
-                # ],
-                isolate_fastener_type(self.fastener_type, self.fastener_data)[
-                    self.size
-                ],
-                is_metric=self.is_metric,
+            self.nut_data = dict(
+                _fastener_type_data(type(self))[self.fastener_type][self.size]
             )
         except KeyError as e:
             raise ValueError(
                 f"{size} invalid, must be one of {self.sizes(self.fastener_type)}"
             ) from e
-        if method_exists(self.__class__, "custom_make"):
-            cq_object = self.custom_make()
+        key = (type(self), self.size, self.fastener_type, self.hand, self.simple)
+        if key in _fastener_shapes:
+            shape = _get_fastener_shape(key)
         else:
-            cq_object = self.make_nut().val()
+            if method_exists(self.__class__, "custom_make"):
+                cq_object = self.custom_make()
+            else:
+                cq_object = self.make_nut().val()
 
-        # Unwrap the Compound - it always gets generated but is unnecessary
-        # (possibly due to some cadquery internals that might change)
-        if isinstance(cq_object, Compound) and len(cq_object.Solids()) == 1:
-            super().__init__(cq_object.Solids()[0].wrapped)
-        else:
-            super().__init__(cq_object.wrapped)
+            # Unwrap the Compound - it always gets generated but is unnecessary
+            # (possibly due to some cadquery internals that might change)
+            if isinstance(cq_object, Compound) and len(cq_object.Solids()) == 1:
+                cq_object = cq_object.Solids()[0]
+            shape = cq_object.wrapped
+            _set_fastener_shape(key, shape)
+
+        super().__init__(BRepBuilderAPI_Copy(shape).Shape())
 
     def make_nut(self) -> cq.Workplane:
         """Create a screw head from the 2D shapes defined in the derived class"""
 
-        # pylint: disable=no-member
-        profile = self.nut_profile()
-        max_nut_height = profile.vertices(">Z").val().Z
-        nut_thread_height = self.nut_data["m"]
-
-        # Create the basic nut shape
-        nut = profile.toPending().revolve()
-
-        # Modify the head to conform to the shape of head_plan (e.g. hex)
-        # Note that some nuts (e.g. domed nuts) extend beyond the threaded section
-        nut_blank = (
-            cq.Workplane("XY")
-            .add(self.nut_plan().val())
-            .toPending()
-            .extrude(max_nut_height)
-            .faces("<Z")
-            .workplane()
-            .hole(self.thread_diameter, nut_thread_height)
-        )
-        nut = nut.intersect(nut_blank)
-
-        # Add a flange as it exists outside of the head plan
-        if method_exists(self.__class__, "flange_profile"):
-            flange = (
-                cq.Workplane("XZ")
-                .add(self.flange_profile().val())
-                .toPending()
-                .revolve()
-            )
-            flange = (
-                cq.Workplane("XY")
-                .add(flange)
-                .toPending()
-                .faces(">Z")
-                .hole(self.thread_diameter)
-            )
-            nut = nut.union(flange)
+        nut = self.make_nut_body()
 
         # Add the thread to the nut body
         if not self.simple:
@@ -634,32 +793,87 @@ class Nut(ABC, Solid):
 
         return nut
 
+    def make_nut_body(self) -> cq.Workplane:
+        """Create the unthreaded nut body, reusing that of an identical nut
+
+        The body is independent of the thread hand and detail, so it is cached
+        separately and shared by the simple and threaded versions of a nut.
+        """
+        key = ("body", type(self), self.size, self.fastener_type)
+        if key in _fastener_shapes:
+            shape = _get_fastener_shape(key)
+        else:
+            # pylint: disable=no-member
+            profile = self.nut_profile()
+            max_nut_height = profile.vertices(">Z").val().Z
+            nut_thread_height = self.nut_data["m"]
+
+            # Create the basic nut shape
+            nut = profile.toPending().revolve()
+
+            # Modify the head to conform to the shape of head_plan (e.g. hex)
+            # Note that some nuts (e.g. domed nuts) extend beyond the threaded section
+            nut_blank = (
+                cq.Workplane("XY")
+                .add(self.nut_plan().val())
+                .toPending()
+                .extrude(max_nut_height)
+                .faces("<Z")
+                .workplane()
+                .hole(self.thread_diameter, nut_thread_height)
+            )
+            nut = nut.intersect(nut_blank)
+
+            # Add a flange as it exists outside of the head plan
+            if method_exists(self.__class__, "flange_profile"):
+                flange = (
+                    cq.Workplane("XZ")
+                    .add(self.flange_profile().val())
+                    .toPending()
+                    .revolve()
+                )
+                flange = (
+                    cq.Workplane("XY")
+                    .add(flange)
+                    .toPending()
+                    .faces(">Z")
+                    .hole(self.thread_diameter)
+                )
+                nut = nut.union(flange)
+            shape = nut.val().wrapped
+            _set_fastener_shape(key, shape)
+
+        return cq.Workplane("XY").add(cq.Shape.cast(BRepBuilderAPI_Copy(shape).Shape()))
+
     def default_nut_profile(self):
         """Create 2D profile of hex nuts with double chamfers"""
         (m, s) = (self.nut_data[p] for p in ["m", "s"])
         e = polygon_diagonal(s, 6)
         # Chamfer angle must be between 15 and 30 degrees
-        cs = (e - s) * tan(radians(15)) / 2
+        cs = (e - s) * _TAN_CHAMFER_ANGLE / 2
 
         # Note that when intersecting a revolved shape with a extruded polygon the OCCT
         # core may fail unless the polygon is slightly larger than the circle so
         # all profiles must be reduced by a small fudge factor
         profile = (
             cq.Workplane("XZ")
-            .hLineTo(s / 2)
-            .lineTo(e / 2 - 0.001, cs)
-            .vLineTo(m - cs)
-            .lineTo(s / 2, m)
-            .hLineTo(0)
+            .polyline(
+                [
+                    (0, 0),
+                    (s / 2, 0),
+                    (e / 2 - 0.001, cs),
+                    (e / 2 - 0.001, m - cs),
+                    (s / 2, m),
+                    (0, m),
+                ]
+            )
             .close()
         )
         return profile
-        # return cq.Workplane("XZ").rect(e, m, centered=False)
 
     def default_nut_plan(self) -> cq.Workplane:
         """Create a hexagon solid"""
         return cq.Workplane("XY").polygon(6, polygon_diagonal(self.nut_data["s"]))
-        # return cq.Workplane("XY").circle(self.nut_data["s"] / 2)
 
     def default_countersink_profile(self, fit) -> cq.Workplane:
         """A simple rectangle with gets revolved into a cylinder with an
@@ -687,7 +901,7 @@ class DomedCapNut(Nut):
         (dk, m, s) = (self.nut_data[p] for p in ["dk", "m", "s"])
         e = polygon_diagonal(s, 6)
         # Chamfer angle must be between 15 and 30 degrees
-        cs = (e - s) * tan(radians(15)) / 2
+        cs = (e - s) * _TAN_CHAMFER_ANGLE / 2
         profile = (
             cq.Workplane("XZ")
             .moveTo(1 * MM, 0)
@@ -752,12 +966,9 @@ class BradTeeNut(Nut):
         (dc, s, m, c) = (self.nut_data[p] for p in ["dc", "s", "m", "c"])
         return (
             cq.Workplane("XZ")
-            .vLine(m)
-            .hLine(dc / 2)
-            .vLine(-c)
-            .hLineTo(s)
-            .vLineTo(0)
-            .hLineTo(0)
+            .polyline(
+                [(0, 0), (0, m), (dc / 2, m), (dc / 2, m - c), (s, m - c), (s, 0)]
+            )
             .close()
         )
 
@@ -834,19 +1045,20 @@ class HeatSetNut(Nut):
         """
 
         # Start by creating helical edges for the inside and outside of the knurling
+        # Each helix is built once and rotated into position for every tip
         lefthand = hand == "left"
+        inside_helix = cq.Wire.makeHelix(
+            pitch, height, diameter / 2 - knurl_depth, lefthand=lefthand
+        ).Edges()[0]
+        outside_helix = cq.Wire.makeHelix(
+            pitch, height, diameter / 2, lefthand=lefthand
+        ).Edges()[0]
         inside_edges = [
-            cq.Wire.makeHelix(
-                pitch, height, diameter / 2 - knurl_depth, lefthand=lefthand
-            )
-            .Edges()[0]
-            .rotate(cq.Vector(0, 0, 0), cq.Vector(0, 0, 1), i * 360 / tip_count)
+            inside_helix.rotate(_ORIGIN, _Z_AXIS, i * 360 / tip_count)
             for i in range(tip_count)
         ]
         outside_edges = [
-            cq.Wire.makeHelix(pitch, height, diameter / 2, lefthand=lefthand)
-            .Edges()[0]
-            .rotate(cq.Vector(0, 0, 0), cq.Vector(0, 0, 1), (i + 0.5) * 360 / tip_count)
+            outside_helix.rotate(_ORIGIN, _Z_AXIS, (i + 0.5) * 360 / tip_count)
             for i in range(tip_count)
         ]
         # Connect the bottoms of the helical edges into a star shaped bottom face
@@ -911,8 +1123,8 @@ class HeatSetNut(Nut):
             [
                 cq.Wire.makeCircle(
                     bottom_hole_radius,
-                    center=cq.Vector(0, 0, 0),
-                    normal=cq.Vector(0, 0, 1),
+                    center=_ORIGIN,
+                    normal=_Z_AXIS,
                 )
             ],
         )
@@ -922,7 +1134,7 @@ class HeatSetNut(Nut):
                 cq.Wire.makeCircle(
                     top_hole_radius,
                     center=cq.Vector(0, 0, height),
-                    normal=cq.Vector(0, 0, 1),
+                    normal=_Z_AXIS,
                 )
             ],
         )
@@ -973,8 +1185,8 @@ class HeatSetNut(Nut):
             [
                 cq.Wire.makeCircle(
                     self.thread_diameter / 2,
-                    center=cq.Vector(0, 0, 0),
-                    normal=cq.Vector(0, 0, 1),
+                    center=_ORIGIN,
+                    normal=_Z_AXIS,
                 )
             ],
         )
@@ -1090,13 +1302,10 @@ class HeatSetNut(Nut):
         hole_radius = (
             drill_sizes[self.nut_data["drill"].strip()] / 2 + manufacturingCompensation
         )
-        # chamfer_size = self.nut_data["s"] / 2 - hole_radius
         return (
             cq.Workplane("XZ")
             .hLine(hole_radius)
             .vLine(self.nut_data["m"])
-            # .vLine(self.nut_data["m"]-chamfer_size)
-            # .lineTo(self.nut_data["s"] / 2, self.nut_data["m"])
             .hLineTo(0)
             .close()
         )
@@ -1213,13 +1422,18 @@ class SquareNut(Nut):
         (m, s) = (self.nut_data[p] for p in ["m", "s"])
         e = polygon_diagonal(s, 4)
         # Chamfer angle must be between 15 and 30 degrees
-        cs = (e - s) * tan(radians(15)) / 2
+        cs = (e - s) * _TAN_CHAMFER_ANGLE / 2
         profile = (
             cq.Workplane("XZ")
-            .hLineTo(e / 2 - 0.001)
-            .vLineTo(m - cs)
-            .lineTo(s / 2, m)
-            .hLineTo(0)
+            .polyline(
+                [
+                    (0, 0),
+                    (e / 2 - 0.001, 0),
+                    (e / 2 - 0.001, m - cs),
+                    (s / 2, m),
+                    (0, m),
+                ]
+            )
             .close()
         )
         return profile
@@ -1308,7 +1522,7 @@ class Screw(ABC, Solid):
     def clearance_drill_sizes(self):
         """A dictionary of drill sizes for clearance holes"""
         try:
-            return self.clearance_hole_drill_sizes[self.thread_size.split("-")[0]]
+            return self.clearance_hole_drill_sizes[self.diameter_size]
         except KeyError as e:
             raise ValueError(
                 f"No clearance hole data for size {self.thread_size}"
@@ -1318,7 +1532,7 @@ class Screw(ABC, Solid):
     def clearance_hole_diameters(self):
         """A dictionary of drill diameters for clearance holes"""
         try:
-            return self.clearance_hole_data[self.thread_size.split("-")[0]]
+            return self.clearance_hole_data[self.diameter_size]
         except KeyError as e:
             raise ValueError(
                 f"No clearance hole data for size {self.thread_size}"
@@ -1343,15 +1557,20 @@ class Screw(ABC, Solid):
         """Return a dictionary of list of fastener types of this size"""
         return select_by_size_fn(cls, size)
 
+    def __init_subclass__(cls, **kwargs):
+        """Register each derived class and record its fastener types when defined"""
+        super().__init_subclass__(**kwargs)
+        _register_fastener_class(cls)
+
     @classmethod
     def types(cls) -> List[str]:
         """Return a set of the screw types"""
-        return set(p.split(":")[0] for p in list(cls.fastener_data.values())[0].keys())
+        return set(cls._fastener_types)
 
     @classmethod
     def sizes(cls, fastener_type: str) -> List[str]:
         """Return a list of the screw sizes for the given type"""
-        return list(isolate_fastener_type(fastener_type, cls.fastener_data).keys())
+        return list(_fastener_type_data(cls).get(fastener_type, {}).keys())
 
     def length_offset(self):
         """
@@ -1385,7 +1604,7 @@ class Screw(ABC, Solid):
         if (
             range_min is None
             or range_max is None
-            or not self.fastener_type in Screw.nominal_length_range.keys()
+            or not self.fastener_type in Screw.nominal_length_range
         ):
             result = None
         else:
@@ -1412,7 +1631,6 @@ class Screw(ABC, Solid):
         warn("cq_object will be deprecated.", DeprecationWarning, stacklevel=2)
         return Solid(self.wrapped)
 
-    # @cache
     def __init__(
         self,
         size: str,
@@ -1431,17 +1649,12 @@ class Screw(ABC, Solid):
             )
 
         self.thread_size = size
+        self.diameter_size = size_parts[0]
         self.is_metric = self.thread_size[0] == "M"
-        if self.is_metric:
-            self.thread_diameter = float(size_parts[0][1:])
-            self.thread_pitch = float(size_parts[1])
-        else:
-            (self.thread_diameter, self.thread_pitch) = decode_imperial_size(
-                self.thread_size
-            )
+        (self.thread_diameter, self.thread_pitch) = decode_thread_size(self.thread_size)
 
         self.length = length
-        if fastener_type not in self.types():
+        if fastener_type not in self._fastener_types:
             raise ValueError(f"{fastener_type} invalid, must be one of {self.types()}")
         self.fastener_type = fastener_type
         if hand in ["left", "right"]:
@@ -1450,11 +1663,8 @@ class Screw(ABC, Solid):
             raise ValueError(f"{hand} invalid, must be one of 'left' or 'right'")
         self.simple = simple
         try:
-            self.screw_data = evaluate_parameter_dict(
-                isolate_fastener_type(self.fastener_type, self.fastener_data)[
-                    self.thread_size
-                ],
-                is_metric=self.is_metric,
+            self.screw_data = dict(
+                _fastener_type_data(type(self))[self.fastener_type][self.thread_size]
             )
         except KeyError as e:
             raise ValueError(
@@ -1469,46 +1679,65 @@ class Screw(ABC, Solid):
             )
         self.max_thread_length = self.length - length_offset
         self.thread_length = length - length_offset
-        head = self.make_head()
-        if head is None:  # A fully custom screw
-            cq_object = None
-            self.head_height = 0
-            self.head_diameter = 0
-        else:
-            head_bb = head.val().BoundingBox()
-            self.head_height = head_bb.zmax
-            self.head_diameter = 2 * max(head_bb.xmax, head_bb.ymax)
-            head = head.translate((0, 0, -self.length_offset()))
-            thread = IsoThread(
-                major_diameter=self.thread_diameter,
-                pitch=self.thread_pitch,
-                length=self.thread_length,
-                external=True,
-                hand=self.hand,
-                end_finishes=("fade", "raw"),
-                simple=self.simple,
-            )
-
-            shank = (
-                cq.Workplane("XY")
-                .circle(thread.min_radius)
-                .extrude(self.thread_length)
-                .val()
-            )
-            if not self.simple:
-                shank = shank.fuse(thread)
-
-        if method_exists(self.__class__, "custom_make"):
-            cq_object = self.custom_make()
-        else:
-            cq_object = head.union(shank.translate(cq.Vector(0, 0, -self.length))).val()
-
-        # Unwrap the Compound - it always gets generated but is unnecessary
-        # (possibly due to some cadquery internals that might change)
-        if isinstance(cq_object, Compound) and len(cq_object.Solids()) == 1:
-            super().__init__(cq_object.Solids()[0].wrapped)
+        key = (
+            type(self),
+            self.size,
+            self.length,
+            self.fastener_type,
+            self.hand,
+            self.simple,
+            self.socket_clearance,
+        )
+        if key in _fastener_shapes:
+            screw_shape = _get_fastener_shape(key)
         else:
-            super().__init__(cq_object.wrapped)
+            head = self.make_head()
+            if head is None:  # A fully custom screw
+                cq_object = None
+                self.head_height = 0
+                self.head_diameter = 0
+            else:
+                head_bb = head.val().BoundingBox()
+                self.head_height = head_bb.zmax
+                self.head_diameter = 2 * max(head_bb.xmax, head_bb.ymax)
+                head = head.translate((0, 0, -self.length_offset()))
+                min_radius = IsoThread.calculate_min_radius(
+                    self.thread_diameter, self.thread_pitch
+                )
+                shank = (
+                    cq.Workplane("XY")
+                    .circle(min_radius)
+                    .extrude(self.thread_length)
+                    .val()
+                )
+                # Only create the thread if it's going to be used
+                if not self.simple:
+                    thread = IsoThread(
+                        major_diameter=self.thread_diameter,
+                        pitch=self.thread_pitch,
+                        length=self.thread_length,
+                        external=True,
+                        hand=self.hand,
+                        end_finishes=("fade", "raw"),
+                    )
+                    shank = shank.fuse(thread)
+
+            if method_exists(self.__class__, "custom_make"):
+                cq_object = self.custom_make()
+            else:
+                cq_object = head.union(
+                    shank.translate(cq.Vector(0, 0, -self.length))
+                ).val()
+
+            # Unwrap the Compound - it always gets generated but is unnecessary
+            # (possibly due to some cadquery internals that might change)
+            if isinstance(cq_object, Compound) and len(cq_object.Solids()) == 1:
+                cq_object = cq_object.Solids()[0]
+            screw_shape = (cq_object.wrapped, self.head_height, self.head_diameter)
+            _set_fastener_shape(key, screw_shape)
+
+        (shape, self.head_height, self.head_diameter) = screw_shape
+        super().__init__(BRepBuilderAPI_Copy(shape).Shape())
 
     def make_head(self) -> cq.Workplane:
         """Create a screw head from the 2D shapes defined in the derived class"""
@@ -1522,8 +1751,10 @@ class Screw(ABC, Solid):
         if has_profile:
             # pylint: disable=no-member
             profile = self.head_profile()
-            max_head_height = profile.vertices(">Z").val().Z
-            max_head_radius = profile.vertices(">X").val().X
+            # Find the extents of the profile with a single pass over its vertices
+            profile_vertices = profile.vertices().vals()
+            max_head_height = max(v.Z for v in profile_vertices)
+            max_head_radius = max(v.X for v in profile_vertices)
 
             # Create the basic head shape
             head = cq.Workplane("XZ").add(profile.val()).toPending().revolve()
@@ -1535,7 +1766,6 @@ class Screw(ABC, Solid):
             # As the slot cuts across the entire head it must go outside of the top
             # face. By creating an overly large head plan the slot can be safely
             # contained within and it doesn't clip the revolved profile.
-            # head_plan = cq.Workplane("XY").circle(max_head_radius)
             head_plan = cq.Workplane("XY").rect(
                 3 * max_head_radius, 3 * max_head_radius
             )
@@ -1692,7 +1922,6 @@ class ButtonHeadWithCollarScrew(Screw):
 
     head_recess = Screw.default_head_recess
 
-    # countersink_profile = Screw.default_countersink_profile
     def countersink_profile(
         self, fit: Literal["Close", "Normal", "Loose"]
     ) -> cq.Workplane:
@@ -1770,7 +1999,12 @@ class CounterSunkScrew(Screw):
             .polarLine(side_length, -90 - a / 2)
             .close()
         )
-        vertices = profile.toPending().edges(">Z").vertices(">X").vals()
+        # The outside top corner of the profile is at a known location
+        vertices = (
+            profile.toPending()
+            .vertices(cq.selectors.NearestToPointSelector((dk / 2, 0, k)))
+            .vals()
+        )
         return profile.fillet2D(k * 0.075, vertices)
 
     head_recess = Screw.default_head_recess
@@ -1810,7 +2044,7 @@ class HexHeadScrew(Screw):
         (k, s) = (self.screw_data[p] for p in ["k", "s"])
         e = polygon_diagonal(s, 6)
         # Chamfer angle must be between 15 and 30 degrees
-        cs = (e - s) * tan(radians(15)) / 2
+        cs = (e - s) * _TAN_CHAMFER_ANGLE / 2
         profile = (
             cq.Workplane("XZ")
             .hLineTo(e / 2)
@@ -1916,7 +2150,7 @@ class PanHeadScrew(Screw):
             .hLineTo(dk / 2)
             .spline(
                 [(dk * 0.25, k)],
-                tangents=[(-sin(radians(5)), cos(radians(5))), (-1, 0)],
+                tangents=[_PAN_HEAD_SIDE_TANGENT, (-1, 0)],
                 includeCurrent=True,
             )
             .hLineTo(0)
@@ -2027,7 +2261,12 @@ class RaisedCounterSunkOvalHeadScrew(Screw):
             .polarLine(side_length, -90 - a / 2)
             .close()
         )
-        vertices = profile.toPending().edges(">Z").vertices(">X").vals()
+        # The outside top corner of the profile is at a known location
+        vertices = (
+            profile.toPending()
+            .vertices(cq.selectors.NearestToPointSelector((dk / 2, 0, k)))
+            .vals()
+        )
         return profile.fillet2D(k * 0.075, vertices)
 
     head_recess = Screw.default_head_recess
@@ -2069,23 +2308,17 @@ class SetScrew(Screw):
         (s, t) = (self.screw_data[p] for p in ["s", "t"])
         e = polygon_diagonal(s, 6)
 
-        thread = IsoThread(
-            major_diameter=self.thread_diameter,
-            pitch=self.thread_pitch,
-            length=self.length,
-            external=True,
-            end_finishes=("fade", "fade"),
-            hand=self.hand,
-            simple=self.simple,
+        min_radius = IsoThread.calculate_min_radius(
+            self.thread_diameter, self.thread_pitch
         )
         core = (
             cq.Workplane("XY")
-            .circle(thread.min_radius)
+            .circle(min_radius)
             .polygon(6, e)
             .extrude(t)
             .faces(">Z")
             .workplane()
-            .circle(thread.min_radius)
+            .circle(min_radius)
             .extrude(self.length - t)
             .mirror()
         )
@@ -2093,6 +2326,14 @@ class SetScrew(Screw):
         if self.simple:
             ret = core
         else:
+            thread = IsoThread(
+                major_diameter=self.thread_diameter,
+                pitch=self.thread_pitch,
+                length=self.length,
+                external=True,
+                end_finishes=("fade", "fade"),
+                hand=self.hand,
+            )
             ret = core.union(thread.translate((0, 0, -thread.length)))
 
         return ret.val()
@@ -2122,7 +2363,12 @@ class SocketHeadCapScrew(Screw):
         """Socket Head Cap Screws"""
         (dk, k) = (self.screw_data[p] for p in ["dk", "k"])
         profile = cq.Workplane("XZ").rect(dk / 2, k, centered=False)
-        vertices = profile.toPending().edges(">Z").vertices(">X").vals()
+        # The outside top corner of the profile is at a known location
+        vertices = (
+            profile.toPending()
+            .vertices(cq.selectors.NearestToPointSelector((dk / 2, 0, k)))
+            .vals()
+        )
         return profile.fillet2D(k * 0.075, vertices)
 
     head_recess = Screw.default_head_recess
@@ -2168,7 +2414,7 @@ class Washer(ABC, Solid):
     def clearance_hole_diameters(self):
         """A dictionary of drill diameters for clearance holes"""
         try:
-            return self.clearance_hole_data[self.thread_size.split("-")[0]]
+            return self.clearance_hole_data[self.diameter_size]
         except KeyError as e:
             raise ValueError(
                 f"No clearance hole data for size {self.thread_size}"
@@ -2196,15 +2442,20 @@ class Washer(ABC, Solid):
         """Which derived class created this washer"""
         return type(self).__name__
 
+    def __init_subclass__(cls, **kwargs):
+        """Register each derived class and record its fastener types when defined"""
+        super().__init_subclass__(**kwargs)
+        _register_fastener_class(cls)
+
     @classmethod
     def types(cls) -> List[str]:
         """Return a set of the washer types"""
-        return set(p.split(":")[0] for p in list(cls.fastener_data.values())[0].keys())
+        return set(cls._fastener_types)
 
     @classmethod
     def sizes(cls, fastener_type: str) -> List[str]:
         """Return a list of the washer sizes for the given type"""
-        return list(isolate_fastener_type(fastener_type, cls.fastener_data).keys())
+        return list(_fastener_type_data(cls).get(fastener_type, {}).keys())
 
     @classmethod
     def select_by_size(cls, size: str) -> dict:
@@ -2219,10 +2470,7 @@ class Washer(ABC, Solid):
     @property
     def washer_diameter(self):
         """Calculate the maximum diameter of the washer"""
-        vertices = cq.Workplane(self).vertices().vals()
-        radii = [
-            (cq.Vector(0, 0, v.Z) - cq.Vector(v.toTuple())).Length for v in vertices
-        ]
+        radii = [hypot(v.X, v.Y) for v in self.Vertices()]
         return 2 * max(radii)
 
     @property
@@ -2231,7 +2479,6 @@ class Washer(ABC, Solid):
         warn("cq_object will be deprecated.", DeprecationWarning, stacklevel=2)
         return Solid(self.wrapped)
 
-    # @cache
     def __init__(
         self,
         size: str,
@@ -2239,6 +2486,7 @@ class Washer(ABC, Solid):
     ):
         self.size = size
         self.thread_size = size
+        self.diameter_size = size
         self.is_metric = self.thread_size[0] == "M"
         # Used only for clearance gap calculations
         if self.is_metric:
@@ -2246,23 +2494,25 @@ class Washer(ABC, Solid):
         else:
             self.thread_diameter = imperial_str_to_float(size)
 
-        if fastener_type not in self.types():
+        if fastener_type not in self._fastener_types:
             raise ValueError(f"{fastener_type} invalid, must be one of {self.types()}")
         self.fastener_type = fastener_type
         try:
-            self.washer_data = evaluate_parameter_dict(
-                isolate_fastener_type(self.fastener_type, self.fastener_data)[
-                    self.thread_size
-                ],
-                is_metric=self.is_metric,
+            self.washer_data = dict(
+                _fastener_type_data(type(self))[self.fastener_type][self.thread_size]
             )
         except KeyError as e:
             raise ValueError(
                 f"{size} invalid, must be one of {self.sizes(self.fastener_type)}"
             ) from e
-        cq_object = self.make_washer().val()
+        key = (type(self), self.size, self.fastener_type)
+        if key in _fastener_shapes:
+            shape = _get_fastener_shape(key)
+        else:
+            shape = self.make_washer().val().wrapped
+            _set_fastener_shape(key, shape)
 
-        super().__init__(cq_object.wrapped)
+        super().__init__(BRepBuilderAPI_Copy(shape).Shape())
 
     def make_washer(self) -> cq.Workplane:
         """Create a screw head from the 2D shapes defined in the derived class"""
@@ -2276,10 +2526,7 @@ class Washer(ABC, Solid):
         (d1, d2, h) = (self.washer_data[p] for p in ["d1", "d2", "h"])
         profile = (
             cq.Workplane("XZ")
-            .moveTo(d1 / 2, 0)
-            .hLineTo(d2 / 2)
-            .vLineTo(h)
-            .hLineTo(d1 / 2)
+            .polyline([(d1 / 2, 0), (d2 / 2, 0), (d2 / 2, h), (d1 / 2, h)])
             .close()
         )
         return profile
@@ -2328,11 +2575,15 @@ class ChamferedWasher(Washer):
         (d1, d2, h) = (self.washer_data[p] for p in ["d1", "d2", "h"])
         profile = (
             cq.Workplane("XZ")
-            .moveTo(d1 / 2, 0)
-            .hLineTo(d2 / 2)
-            .vLineTo(0.75 * h)
-            .lineTo(d2 / 2 - h * 0.25, h)
-            .hLineTo(d1 / 2)
+            .polyline(
+                [
+                    (d1 / 2, 0),
+                    (d2 / 2, 0),
+                    (d2 / 2, 0.75 * h),
+                    (d2 / 2 - h * 0.25, h),
+                    (d1 / 2, h),
+                ]
+            )
             .close()
         )
         return profile
@@ -2356,12 +2607,16 @@ class CheeseHeadWasher(Washer):
         (d1, d2, h) = (self.washer_data[p] for p in ["d1", "d2", "h"])
         profile = (
             cq.Workplane("XZ")
-            .moveTo(d1 / 2 + h / 4, 0)
-            .hLineTo(d2 / 2)
-            .vLineTo(h)
-            .hLineTo(d1 / 2 + h / 4)
-            .lineTo(d1 / 2, 0.75 * h)
-            .vLineTo(h / 4)
+            .polyline(
+                [
+                    (d1 / 2 + h / 4, 0),
+                    (d2 / 2, 0),
+                    (d2 / 2, h),
+                    (d1 / 2 + h / 4, h),
+                    (d1 / 2, 0.75 * h),
+                    (d1 / 2, h / 4),
+                ]
+            )
             .close()
         )
         return profile
@@ -175,13 +175,15 @@ class Sprocket(Solid):
         )
 
         # Chamfer the outside edges if the sprocket has "flat" teeth determined by ..
-        # .. extracting all the unique radii
-        arc_list = {round(a.radius(), 7) for a in sprocket.edges("%circle").vals()}
-        self._flat_teeth = len(arc_list) == 3
+        # .. extracting all the unique radii - reuse them to select the outer edges
+        arcs = sprocket.edges("%circle").vals()
+        arc_radii = [round(a.radius(), 7) for a in arcs]
+        self._flat_teeth = len(set(arc_radii)) == 3
         if self._flat_teeth:
-            sprocket = sprocket.edges(cq.selectors.RadiusNthSelector(2)).chamfer(
-                self.thickness * 0.25, self.thickness * 0.5
-            )
+            outer_radius = max(arc_radii)
+            sprocket = sprocket.newObject(
+                [a for a, r in zip(arcs, arc_radii) if r == outer_radius]
+            ).chamfer(self.thickness * 0.25, self.thickness * 0.5)
         #
         # Create bolt holes
         if (
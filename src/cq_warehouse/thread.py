@@ -25,37 +25,131 @@ license:
     limitations under the License.
 
 """
+import os
 import re
+import hashlib
+from collections import OrderedDict
+from functools import cache
 from warnings import warn
 from abc import ABC, abstractmethod
 from typing import Literal, Optional, Tuple, List
 from math import sin, cos, tan, radians, pi
-import cadquery as cq
-from cadquery import Solid, Compound
+from fractions import Fraction
+from cadquery import Compound, Face, Shell, Solid, Vector, Wire, Workplane
 from OCP.TopoDS import TopoDS_Shape
-
-# from functools import cached_property, cache
+from OCP.BRep import BRep_Builder
+from OCP.BRepBuilderAPI import BRepBuilderAPI_Copy
+from OCP.BRepTools import BRepTools
+from OCP.Standard import Standard_Failure
 
 MM = 1
 IN = 25.4 * MM
 
+# ISO threads all share the same 60° thread angle
+ISO_THREAD_ANGLE = 60
+ISO_TAN_HALF_ANGLE = tan(radians(ISO_THREAD_ANGLE / 2))
+# The fundamental triangle height H of an ISO thread is this multiple of the pitch
+ISO_H_FACTOR = 1 / (2 * ISO_TAN_HALF_ANGLE)
+
+# Frequently used positioning constants which needn't be rebuilt on every use
+_ORIGIN = Vector(0, 0, 0)
+_Z_AXIS = Vector(0, 0, 1)
+
 
 def is_safe(value: str) -> bool:
-    """Evaluate if the given string is a fractional number safe for eval()"""
+    """Evaluate if the given string is a fractional number safe to convert"""
     return len(value) <= 10 and all(c in "0123456789./ " for c in set(value))
 
 
 def imperial_str_to_float(measure: str) -> float:
     """Convert an imperial measurement (possibly a fraction) to a float value"""
     if is_safe(measure):
-        # pylint: disable=eval-used
-        # Before eval() is called the string extracted from the csv file is verified as safe
-        result = eval(measure.strip().replace(" ", "+")) * IN
+        # Mixed numbers like "1 1/4" are the sum of their space separated terms
+        result = float(sum(Fraction(term) for term in measure.split())) * IN
     else:
         result = measure
     return result
 
 
+@cache
+def _thread_source_digest() -> str:
+    """Digest of this module's source used to invalidate stale cached threads"""
+    with open(__file__, "rb") as source:
+        return hashlib.blake2b(source.read(), digest_size=8).hexdigest()
+
+
+def thread_cache_file(parameters: tuple) -> Optional[str]:
+    """Path to the disk cache file of a thread or None if disk caching is disabled
+
+    Threads are expensive to create so, if the CQ_WAREHOUSE_CACHE environment
+    variable is set to "1", each thread is stored as a BREP file in the
+    directory given by the CQ_WAREHOUSE_CACHE_DIR environment variable
+    (default ~/.cache/cq_warehouse/threads) and reloaded when a thread
+    with identical parameters is created again. The file names include a
+    digest of the thread source code so changes to how threads are built
+    never reuse stale files.
+    """
+    if os.environ.get("CQ_WAREHOUSE_CACHE") != "1":
+        return None
+    cache_dir = os.environ.get(
+        "CQ_WAREHOUSE_CACHE_DIR", "~/.cache/cq_warehouse/threads"
+    )
+    key = hashlib.blake2b(repr(parameters).encode(), digest_size=16).hexdigest()
+    return os.path.join(
+        os.path.expanduser(cache_dir), f"{_thread_source_digest()}-{key}.brep"
+    )
+
+
+def _read_cached_thread(cache_file: str) -> Optional[TopoDS_Shape]:
+    """Read a thread from the disk cache or None if it's missing or unreadable"""
+    if not os.path.exists(cache_file):
+        return None
+    thread = TopoDS_Shape()
+    try:
+        read = BRepTools.Read_s(thread, cache_file, BRep_Builder())
+    except Standard_Failure:
+        # Truncated files may raise rather than fail to read
+        return None
+    return thread if read and not thread.IsNull() else None
+
+
+def _write_cached_thread(cache_file: str, thread: TopoDS_Shape):
+    """Store a thread in the disk cache, ignoring failures as the cache is optional
+
+    The thread is written to a temporary file and then renamed so that other
+    processes never read a partially written file.
+    """
+    temp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        written = BRepTools.Write_s(thread, temp_file)
+        if written:
+            os.replace(temp_file, cache_file)
+    except OSError:
+        written = False
+    if not written and os.path.exists(temp_file):
+        os.remove(temp_file)
+
+
+def store_recently_used(cache: OrderedDict, key: tuple, value, max_size: int):
+    """Store a value in a cache, discarding the least recently used beyond max_size"""
+    cache[key] = value
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+
+
+# Recently built threads keyed by their construction parameters. Instances
+# are given a copy of the stored shape so each thread remains a distinct object.
+THREAD_CACHE_SIZE = 64
+_thread_shapes = OrderedDict()
+
+# Faces of faded thread ends keyed by thread profile, bounded like the threads
+_fade_faces = OrderedDict()
+
+# Thread helices keyed by their construction parameters, bounded like the threads
+_helix_wires = OrderedDict()
+
+
 class Thread(Solid):
     """Helical thread
 
@@ -91,6 +185,7 @@ class Thread(Solid):
         simple: Stop at thread calculation, don't create thread. Defaults to False.
 
     Raises:
+        ValueError: if hand not in ["right", "left"]:
         ValueError: if end_finishes not in ["raw", "square", "fade", "chamfer"]:
     """
 
@@ -99,22 +194,18 @@ class Thread(Solid):
     ) -> Tuple[float, float, float]:
         """A helical function used to create the faded tips of threads that spirals
         self.tooth_height in self.pitch/4"""
-        if self.external:
-            radius = (
-                self.apex_radius - sin(t * pi / 2) * self.tooth_height
-                if apex
-                else self.root_radius
-            )
+        angle = t * pi / 2
+        sin_angle = sin(angle)
+        if not apex:
+            radius = self.root_radius
+        elif self.external:
+            radius = self.apex_radius - sin_angle * self.tooth_height
         else:
-            radius = (
-                self.apex_radius + sin(t * pi / 2) * self.tooth_height
-                if apex
-                else self.root_radius
-            )
+            radius = self.apex_radius + sin_angle * self.tooth_height
 
-        z_pos = t * self.pitch / 4 + t * vertical_displacement
-        x_pos = radius * cos(t * pi / 2)
-        y_pos = radius * sin(t * pi / 2)
+        z_pos = t * (self.pitch / 4 + vertical_displacement)
+        x_pos = radius * cos(angle)
+        y_pos = radius * sin_angle
         return (x_pos, y_pos, z_pos)
 
     @property
@@ -141,6 +232,9 @@ class Thread(Solid):
         simple: bool = False,
     ):
         """Store the parameters and create the thread object"""
+        # All of the other thread classes rely on this validation
+        if hand not in ["right", "left"]:
+            raise ValueError(f'hand must be one of "right" or "left" not {hand}')
         for finish in end_finishes:
             if finish not in ["raw", "square", "fade", "chamfer"]:
                 raise ValueError(
@@ -165,42 +259,72 @@ class Thread(Solid):
         self.simple = simple
 
         if not simple:
-            # Create base cylindrical thread
-            number_faded_ends = self.end_finishes.count("fade")
-            cylindrical_thread_length = self.length + self.pitch * (
-                1 - 1 * number_faded_ends
+            key = (
+                type(self).__name__,
+                apex_radius,
+                apex_width,
+                root_radius,
+                root_width,
+                pitch,
+                length,
+                apex_offset,
+                hand,
+                taper_angle,
+                tuple(end_finishes),
             )
-            if self.end_finishes[0] == "fade":
-                cylindrical_thread_displacement = self.pitch / 2
-            else:
-                cylindrical_thread_displacement = -self.pitch / 2
-
-            # Either create a cylindrical thread for further processing
-            # or create a cylindrical thread segment with faded ends
-            if number_faded_ends == 0:
-                cq_object = self.make_thread_solid(cylindrical_thread_length).translate(
-                    (0, 0, cylindrical_thread_displacement)
-                )
+            if key in _thread_shapes:
+                _thread_shapes.move_to_end(key)
+                thread = _thread_shapes[key]
             else:
-                cq_object = self.make_thread_with_faded_ends(
-                    number_faded_ends,
-                    cylindrical_thread_length,
-                    cylindrical_thread_displacement,
-                )
-
-            # Square off ends if requested
-            cq_object = self.square_off_ends(cq_object)
-            # Chamfer ends if requested
-            cq_object = self.chamfer_ends(cq_object)
-            if isinstance(cq_object, Compound) and len(cq_object.Solids()) == 1:
-                super().__init__(cq_object.Solids()[0].wrapped)
-            else:
-                super().__init__(cq_object.wrapped)
+                cache_file = thread_cache_file(key)
+                thread = None
+                if cache_file is not None:
+                    # Rebuild (and rewrite) threads whose file can't be read
+                    thread = _read_cached_thread(cache_file)
+                if thread is None:
+                    thread = self.make_thread().wrapped
+                    if cache_file is not None:
+                        _write_cached_thread(cache_file, thread)
+                store_recently_used(_thread_shapes, key, thread, THREAD_CACHE_SIZE)
+            super().__init__(BRepBuilderAPI_Copy(thread).Shape())
         else:
             # Initialize with a valid shape then nullify
             super().__init__(Solid.makeBox(1, 1, 1).wrapped)
             self.wrapped = TopoDS_Shape()
 
+    def make_thread(self) -> Solid:
+        """Create the thread object from the stored parameters"""
+        # Create base cylindrical thread
+        number_faded_ends = self.end_finishes.count("fade")
+        cylindrical_thread_length = self.length + self.pitch * (
+            1 - 1 * number_faded_ends
+        )
+        if self.end_finishes[0] == "fade":
+            cylindrical_thread_displacement = self.pitch / 2
+        else:
+            cylindrical_thread_displacement = -self.pitch / 2
+
+        # Either create a cylindrical thread for further processing
+        # or create a cylindrical thread segment with faded ends
+        if number_faded_ends == 0:
+            cq_object = self.make_thread_solid(cylindrical_thread_length).translate(
+                (0, 0, cylindrical_thread_displacement)
+            )
+        else:
+            cq_object = self.make_thread_with_faded_ends(
+                number_faded_ends,
+                cylindrical_thread_length,
+                cylindrical_thread_displacement,
+            )
+
+        # Square off ends if requested
+        cq_object = self.square_off_ends(cq_object)
+        # Chamfer ends if requested
+        cq_object = self.chamfer_ends(cq_object)
+        if isinstance(cq_object, Compound) and len(cq_object.Solids()) == 1:
+            cq_object = cq_object.Solids()[0]
+        return cq_object
+
     def make_thread_with_faded_ends(
         self,
         number_faded_ends,
@@ -221,9 +345,7 @@ class Thread(Solid):
         cylindrical_thread_angle = (
             (360 if self.right_hand else -360) * cylindrical_thread_length / self.pitch
         )
-        (fade_faces, _fade_ends) = self.make_thread_faces(
-            self.pitch / 4, fade_helix=True
-        )
+        fade_faces = self.make_fade_faces()
         if not self.right_hand:
             fade_faces = [f.mirror("XZ") for f in fade_faces]
 
@@ -231,41 +353,84 @@ class Thread(Solid):
             # If the thread is asymmetric the bottom fade end needs to be recreated as
             # no amount of flipping or rotating can generate the shape
             if self.apex_offset != 0:
-                (fade_faces_bottom, _fade_ends) = self.make_thread_faces(
-                    self.pitch / 4, fade_helix=True, asymmetric_flip=True
-                )
+                fade_faces_bottom = self.make_fade_faces(asymmetric_flip=True)
                 if not self.right_hand:
                     fade_faces_bottom = [f.mirror("XZ") for f in fade_faces_bottom]
             else:
                 fade_faces_bottom = fade_faces
             fade_faces_bottom = [
-                f.mirror("XZ").mirror("XY").translate(cq.Vector(0, 0, self.pitch / 2))
+                f.mirror("XZ").mirror("XY").translate(Vector(0, 0, self.pitch / 2))
                 for f in fade_faces_bottom
             ]
         if self.end_finishes[1] == "fade":
             fade_faces_top = [
                 f.translate(
-                    cq.Vector(
+                    Vector(
                         0,
                         0,
                         cylindrical_thread_length + cylindrical_thread_displacement,
                     )
-                ).rotate((0, 0, 0), (0, 0, 1), cylindrical_thread_angle)
+                ).rotate(_ORIGIN, _Z_AXIS, cylindrical_thread_angle)
                 for f in fade_faces
             ]
         if number_faded_ends == 2:
-            thread_shell = cq.Shell.makeShell(
+            thread_shell = Shell.makeShell(
                 thread_faces + fade_faces_bottom + fade_faces_top
             )
         elif self.end_finishes[0] == "fade":
-            thread_shell = cq.Shell.makeShell(
+            thread_shell = Shell.makeShell(
                 thread_faces + fade_faces_bottom + [end_faces[1]]
             )
         else:
-            thread_shell = cq.Shell.makeShell(
+            thread_shell = Shell.makeShell(
                 thread_faces + fade_faces_top + [end_faces[0]]
             )
-        return cq.Solid.makeSolid(thread_shell)
+        return Solid.makeSolid(thread_shell)
+
+    def make_fade_faces(self, asymmetric_flip: bool = False) -> List[Face]:
+        """Create the faces of a faded end, reusing those of an identical profile
+
+        The faded ends don't depend on the length of the thread so they are
+        shared by all the threads with the same profile. The faces are only ever
+        used as the source of transformed copies.
+        """
+        key = (
+            self.apex_radius,
+            self.apex_width,
+            self.root_radius,
+            self.root_width,
+            self.pitch,
+            self.apex_offset,
+            asymmetric_flip,
+        )
+        if key in _fade_faces:
+            _fade_faces.move_to_end(key)
+            return _fade_faces[key]
+        (fade_faces, _fade_ends) = self.make_thread_faces(
+            self.pitch / 4, fade_helix=True, asymmetric_flip=asymmetric_flip
+        )
+        store_recently_used(_fade_faces, key, fade_faces, THREAD_CACHE_SIZE)
+        return fade_faces
+
+    def make_helix(self, length: float, radius: float) -> Wire:
+        """Create a thread helix, reusing one with identical parameters
+
+        As with the faded ends, the helices are only ever used as the source
+        of transformed copies.
+        """
+        key = (self.pitch, length, radius, self.taper, self.right_hand)
+        if key in _helix_wires:
+            _helix_wires.move_to_end(key)
+            return _helix_wires[key]
+        helix = Wire.makeHelix(
+            pitch=self.pitch,
+            height=length,
+            radius=radius,
+            angle=self.taper,
+            lefthand=not self.right_hand,
+        )
+        store_recently_used(_helix_wires, key, helix, THREAD_CACHE_SIZE)
+        return helix
 
     def square_off_ends(self, cq_object: Solid):
         """Square off the ends of the thread"""
@@ -275,17 +440,19 @@ class Thread(Solid):
             # Note: box_size must be > max(apex,root) radius or the core doesn't cut correctly
             half_box_size = 2 * max(self.apex_radius, self.root_radius)
             box_size = 2 * half_box_size
-            cutter = cq.Solid.makeBox(
+            cutter = Solid.makeBox(
                 length=box_size,
                 width=box_size,
                 height=self.length,
-                pnt=cq.Vector(-half_box_size, -half_box_size, -self.length),
+                pnt=Vector(-half_box_size, -half_box_size, -self.length),
             )
-            for i in range(2):
-                if self.end_finishes[i] == "square":
-                    squared = cq_object.cut(
-                        cutter.translate(cq.Vector(0, 0, 2 * i * self.length))
-                    )
+            # Remove both ends in a single boolean operation
+            cutters = [
+                cutter.translate(Vector(0, 0, 2 * i * self.length))
+                for i in range(2)
+                if self.end_finishes[i] == "square"
+            ]
+            squared = cq_object.cut(*cutters)
         return squared
 
     def chamfer_ends(self, cq_object: Solid):
@@ -294,26 +461,27 @@ class Thread(Solid):
         chamfered = cq_object
         if self.end_finishes.count("chamfer") != 0:
             cutter = (
-                cq.Workplane("XY")
+                Workplane("XY")
                 .circle(self.root_radius)
                 .circle(self.apex_radius)
                 .extrude(self.length)
             )
             face_selectors = ["<Z", ">Z"]
-            edge_radius_selector = 1 if self.apex_radius > self.root_radius else 0
+            # The chamfered edge is the outer circle of the annulus end face
+            # for external threads and the inner circle for internal threads
+            select_edge = max if self.apex_radius > self.root_radius else min
             for i in range(2):
                 if self.end_finishes[i] == "chamfer":
-                    cutter = (
-                        cutter.faces(face_selectors[i])
-                        .edges(cq.selectors.RadiusNthSelector(edge_radius_selector))
-                        .chamfer(self.tooth_height * 0.5, self.tooth_height * 0.75)
-                    )
+                    end_edges = cutter.faces(face_selectors[i]).edges().vals()
+                    cutter = cutter.newObject(
+                        [select_edge(end_edges, key=lambda e: e.radius())]
+                    ).chamfer(self.tooth_height * 0.5, self.tooth_height * 0.75)
             chamfered = cq_object.intersect(cutter.val())
         return chamfered
 
     def make_thread_faces(
         self, length: float, fade_helix: bool = False, asymmetric_flip: bool = False
-    ) -> Tuple[List[cq.Face]]:
+    ) -> Tuple[List[Face]]:
         """Create the thread object from basic CadQuery objects
 
         This method creates three types of thread objects:
@@ -330,25 +498,21 @@ class Thread(Solid):
         """
         local_apex_offset = -self.apex_offset if asymmetric_flip else self.apex_offset
         apex_helix_wires = [
-            cq.Workplane("XY")
+            Workplane("XY")
             .parametricCurve(
                 lambda t: self.fade_helix(t, apex=True, vertical_displacement=0)
             )
             .val()
             .translate((0, 0, i * self.apex_width + local_apex_offset))
             if fade_helix
-            else cq.Wire.makeHelix(
-                pitch=self.pitch,
-                height=length,
-                radius=self.apex_radius,
-                angle=self.taper,
-                lefthand=not self.right_hand,
-            ).translate((0, 0, i * self.apex_width + local_apex_offset))
+            else self.make_helix(length, self.apex_radius).translate(
+                (0, 0, i * self.apex_width + local_apex_offset)
+            )
             for i in [-0.5, 0.5]
         ]
         assert apex_helix_wires[0].isValid()
         root_helix_wires = [
-            cq.Workplane("XY")
+            Workplane("XY")
             .parametricCurve(
                 lambda t: self.fade_helix(
                     t,
@@ -359,20 +523,16 @@ class Thread(Solid):
             .val()
             .translate((0, 0, i * self.root_width))
             if fade_helix
-            else cq.Wire.makeHelix(
-                pitch=self.pitch,
-                height=length,
-                radius=self.root_radius,
-                angle=self.taper,
-                lefthand=not self.right_hand,
-            ).translate((0, 0, i * self.root_width))
+            else self.make_helix(length, self.root_radius).translate(
+                (0, 0, i * self.root_width)
+            )
             for i in [-0.5, 0.5]
         ]
         # When creating a cylindrical or tapered thread two end faces are required
         # to enclose the thread object, while faded thread only has one end face
         end_caps = [0] if fade_helix else [0, 1]
         end_cap_wires = [
-            cq.Wire.makePolygon(
+            Wire.makePolygon(
                 [
                     apex_helix_wires[0].positionAt(i),
                     apex_helix_wires[1].positionAt(i),
@@ -384,24 +544,24 @@ class Thread(Solid):
             for i in end_caps
         ]
         thread_faces = [
-            cq.Face.makeRuledSurface(apex_helix_wires[0], apex_helix_wires[1]),
-            cq.Face.makeRuledSurface(apex_helix_wires[1], root_helix_wires[1]),
-            cq.Face.makeRuledSurface(root_helix_wires[1], root_helix_wires[0]),
-            cq.Face.makeRuledSurface(root_helix_wires[0], apex_helix_wires[0]),
+            Face.makeRuledSurface(apex_helix_wires[0], apex_helix_wires[1]),
+            Face.makeRuledSurface(apex_helix_wires[1], root_helix_wires[1]),
+            Face.makeRuledSurface(root_helix_wires[1], root_helix_wires[0]),
+            Face.makeRuledSurface(root_helix_wires[0], apex_helix_wires[0]),
         ]
-        end_faces = [cq.Face.makeFromWires(end_cap_wires[i]) for i in end_caps]
+        end_faces = [Face.makeFromWires(end_cap_wires[i]) for i in end_caps]
         return (thread_faces, end_faces)
 
     def make_thread_solid(
         self,
         length: float,
         fade_helix: bool = False,
-    ) -> cq.Solid:
+    ) -> Solid:
         """Create a solid object by first creating the faces"""
         (thread_faces, end_faces) = self.make_thread_faces(length, fade_helix)
 
-        thread_shell = cq.Shell.makeShell(thread_faces + end_faces)
-        thread_solid = cq.Solid.makeSolid(thread_shell)
+        thread_shell = Shell.makeShell(thread_faces + end_faces)
+        thread_solid = Solid.makeSolid(thread_shell)
         return thread_solid
 
 
@@ -452,22 +612,18 @@ class IsoThread(Solid):
 
     """
 
-    @property
-    def h_parameter(self) -> float:
-        """Calculate the h parameter"""
-        return (self.pitch / 2) / tan(radians(self.thread_angle / 2))
-
-    @property
-    def min_radius(self) -> float:
-        """The radius of the root of the thread"""
-        return (self.major_diameter - 2 * (5 / 8) * self.h_parameter) / 2
-
     @property
     def cq_object(self):
         """A cadquery Solid thread as defined by class attributes"""
         warn("cq_object will be deprecated.", DeprecationWarning, stacklevel=2)
         return Solid(self.wrapped)
 
+    @staticmethod
+    def calculate_min_radius(major_diameter: float, pitch: float) -> float:
+        """The radius of the root of an external thread without creating the thread"""
+        h_parameter = pitch * ISO_H_FACTOR
+        return (major_diameter - 2 * (5 / 8) * h_parameter) / 2
+
     def __init__(
         self,
         major_diameter: float,
@@ -486,15 +642,10 @@ class IsoThread(Solid):
         self.pitch = pitch
         self.length = length
         self.external = external
-        self.thread_angle = 60
-        if hand not in ["right", "left"]:
-            raise ValueError(f'hand must be one of "right" or "left" not {hand}')
+        self.thread_angle = ISO_THREAD_ANGLE
+        self.h_parameter = self.pitch * ISO_H_FACTOR
+        self.min_radius = IsoThread.calculate_min_radius(major_diameter, pitch)
         self.hand = hand
-        for finish in end_finishes:
-            if finish not in ["raw", "square", "fade", "chamfer"]:
-                raise ValueError(
-                    'end_finishes invalid, must be tuple() of "raw, square, taper, or chamfer"'
-                )
         self.end_finishes = end_finishes
         self.simple = simple
         self.apex_radius = self.major_diameter / 2 if external else self.min_radius
@@ -605,14 +756,7 @@ class TrapezoidalThread(ABC, Solid):
             self.apex_radius = self.diameter / 2 - self.pitch / 2
             self.root_radius = self.diameter / 2
 
-        if hand not in ["right", "left"]:
-            raise ValueError(f'hand must be one of "right" or "left" not {hand}')
         self.hand = hand
-        for finish in end_finishes:
-            if not finish in ["raw", "square", "fade", "chamfer"]:
-                raise ValueError(
-                    'end_finishes invalid, must be tuple() of "raw, square, taper, or chamfer"'
-                )
         self.end_finishes = end_finishes
         cq_object = Thread(
             apex_radius=self.apex_radius,
@@ -696,7 +840,7 @@ class AcmeThread(TrapezoidalThread):
     @classmethod
     def parse_size(cls, size: str) -> Tuple[float, float]:
         """Convert the provided size into a tuple of diameter and pitch"""
-        if not size in AcmeThread.acme_pitch.keys():
+        if not size in AcmeThread.acme_pitch:
             raise ValueError(
                 f"size invalid, must be one of {AcmeThread.acme_pitch.keys()}"
             )
@@ -743,7 +887,7 @@ class MetricTrapezoidalThread(TrapezoidalThread):
 
     # Turn off black auto-format for this array as it will be spread over hundreds of lines
     # fmt: off
-    standard_sizes = [
+    standard_sizes = (
 		"8x1.5","9x1.5","9x2","10x1.5","10x2","11x2","11x3","12x2","12x3","14x2",
 		"14x3","16x2","16x3","16x4","18x2","18x3","18x4","20x2","20x3","20x4",
 		"22x3","22x5","22x8","24x3","24x5","24x8","26x3","26x5","26x8","28x3",
@@ -771,7 +915,7 @@ class MetricTrapezoidalThread(TrapezoidalThread):
 		"260x4","260x12","260x20","260x22","260x24","260x40","270x12","270x24",
 		"270x40","275x4","280x4","280x12","280x24","280x40","290x4","290x12",
 		"290x24","290x44","295x4","300x4","300x12","300x24","300x44","310x5","315x5"
-    ]
+    )
     # fmt: on
 
     thread_angle = 30.0  # in degrees
@@ -779,14 +923,14 @@ class MetricTrapezoidalThread(TrapezoidalThread):
     @classmethod
     def sizes(cls) -> List[str]:
         """Return a list of the thread sizes"""
-        return MetricTrapezoidalThread.standard_sizes
+        return list(MetricTrapezoidalThread.standard_sizes)
 
     @classmethod
     def parse_size(cls, size: str) -> Tuple[float, float]:
         """Convert the provided size into a tuple of diameter and pitch"""
         if not size in MetricTrapezoidalThread.standard_sizes:
             raise ValueError(
-                f"size invalid, must be one of {MetricTrapezoidalThread.standard_sizes}"
+                f"size invalid, must be one of {MetricTrapezoidalThread.sizes()}"
             )
         (diameter, pitch) = (float(part) for part in size.split("x"))
         return (diameter, pitch)
@@ -831,90 +975,96 @@ class PlasticBottleThread(Solid):
 
     """
 
-    # {TPI: [root_width,thread_height]}
+    # {TPI: (root_width,thread_height)}
     l_style_thread_dimensions = {
-        4: [3.18, 1.57],
-        5: [3.05, 1.52],
-        6: [2.39, 1.19],
-        8: [2.13, 1.07],
-        12: [1.14, 0.76],
+        4: (3.18, 1.57),
+        5: (3.05, 1.52),
+        6: (2.39, 1.19),
+        8: (2.13, 1.07),
+        12: (1.14, 0.76),
     }
     m_style_thread_dimensions = {
-        4: [3.18, 1.57],
-        5: [3.05, 1.52],
-        6: [2.39, 1.19],
-        8: [2.13, 1.07],
-        12: [1.29, 0.76],
+        4: (3.18, 1.57),
+        5: (3.05, 1.52),
+        6: (2.39, 1.19),
+        8: (2.13, 1.07),
+        12: (1.29, 0.76),
     }
 
     thread_angles = {
-        "L100": [30, 30],
-        "M100": [10, 40],
-        "L103": [30, 30],
-        "M103": [10, 40],
-        "L110": [30, 30],
-        "M110": [10, 50],
-        "L200": [30, 30],
-        "M200": [10, 40],
-        "L400": [30, 30],
-        "M400": [10, 45],
-        "L410": [30, 30],
-        "M410": [10, 45],
-        "L415": [30, 30],
-        "M415": [10, 45],
-        "L425": [30, 30],
-        "M425": [10, 45],
-        "L444": [30, 30],
-        "M444": [10, 45],
+        "L100": (30, 30),
+        "M100": (10, 40),
+        "L103": (30, 30),
+        "M103": (10, 40),
+        "L110": (30, 30),
+        "M110": (10, 50),
+        "L200": (30, 30),
+        "M200": (10, 40),
+        "L400": (30, 30),
+        "M400": (10, 45),
+        "L410": (30, 30),
+        "M410": (10, 45),
+        "L415": (30, 30),
+        "M415": (10, 45),
+        "L425": (30, 30),
+        "M425": (10, 45),
+        "L444": (30, 30),
+        "M444": (10, 45),
+    }
+    # Tangents of the thread angles, used to calculate the thread shoulders
+    thread_angle_tangents = {
+        angle: tan(radians(angle))
+        for angles in thread_angles.values()
+        for angle in angles
     }
 
-    # {finish:[min turns,[diameters,...]]}
+    # {finish:(min turns,(diameters,...))}
     # fmt: off
     finish_data = {
-        100: [1.125,[22,24,28,30,33,35,38]],
-        103: [1.125,[26]],
-        110: [1.125,[28]],
-        200: [1.5,[24.28]],
-        400: [1.0,[18,20,22,24,28,30,33,35,38,40,43,45,48,51,53,58,60,63,66,70,75,77,83,89,100,110,120]],
-        410: [1.5,[18,20,22,24,28]],
-        415: [2.0,[13,15,18,20,22,24,28,30,33]],
-        425: [2.0,[13,15]],
-        444: [1.125,[24,28,30,33,35,38,40,43,45,48,51,53,58,60,63,66,70,75,77,83]]
+        100: (1.125,(22,24,28,30,33,35,38)),
+        103: (1.125,(26,)),
+        110: (1.125,(28,)),
+        200: (1.5,(24.28,)),
+        400: (1.0,(18,20,22,24,28,30,33,35,38,40,43,45,48,51,53,58,60,63,66,70,75,77,83,89,100,110,120)),
+        410: (1.5,(18,20,22,24,28)),
+        415: (2.0,(13,15,18,20,22,24,28,30,33)),
+        425: (2.0,(13,15)),
+        444: (1.125,(24,28,30,33,35,38,40,43,45,48,51,53,58,60,63,66,70,75,77,83))
     }
     # fmt: on
 
-    # {thread_size:[max,min,TPI]}
+    # {thread_size:(max,min,TPI)}
     thread_dimensions = {
-        13: [13.06, 12.75, 12],
-        15: [14.76, 14.45, 12],
-        18: [17.88, 17.47, 8],
-        20: [19.89, 19.48, 8],
-        22: [21.89, 21.49, 8],
-        24: [23.88, 23.47, 8],
-        26: [25.63, 25.12, 8],
-        28: [27.64, 27.13, 6],
-        30: [28.62, 28.12, 6],
-        33: [32.13, 31.52, 6],
-        35: [34.64, 34.04, 6],
-        38: [37.49, 36.88, 6],
-        40: [40.13, 39.37, 6],
-        43: [42.01, 41.25, 6],
-        45: [44.20, 43.43, 6],
-        48: [47.50, 46.74, 6],
-        51: [49.99, 49.10, 6],
-        53: [52.50, 51.61, 6],
-        58: [56.49, 55.60, 6],
-        60: [59.49, 58.60, 6],
-        63: [62.51, 61.62, 6],
-        66: [65.51, 64.62, 6],
-        70: [69.49, 68.60, 6],
-        75: [73.99, 73.10, 6],
-        77: [77.09, 76.20, 6],
-        83: [83.01, 82.12, 5],
-        89: [89.18, 88.29, 5],
-        100: [100.00, 99.11, 5],
-        110: [110.01, 109.12, 5],
-        120: [119.99, 119.10, 5],
+        13: (13.06, 12.75, 12),
+        15: (14.76, 14.45, 12),
+        18: (17.88, 17.47, 8),
+        20: (19.89, 19.48, 8),
+        22: (21.89, 21.49, 8),
+        24: (23.88, 23.47, 8),
+        26: (25.63, 25.12, 8),
+        28: (27.64, 27.13, 6),
+        30: (28.62, 28.12, 6),
+        33: (32.13, 31.52, 6),
+        35: (34.64, 34.04, 6),
+        38: (37.49, 36.88, 6),
+        40: (40.13, 39.37, 6),
+        43: (42.01, 41.25, 6),
+        45: (44.20, 43.43, 6),
+        48: (47.50, 46.74, 6),
+        51: (49.99, 49.10, 6),
+        53: (52.50, 51.61, 6),
+        58: (56.49, 55.60, 6),
+        60: (59.49, 58.60, 6),
+        63: (62.51, 61.62, 6),
+        66: (65.51, 64.62, 6),
+        70: (69.49, 68.60, 6),
+        75: (73.99, 73.10, 6),
+        77: (77.09, 76.20, 6),
+        83: (83.01, 82.12, 5),
+        89: (89.18, 88.29, 5),
+        100: (100.00, 99.11, 5),
+        110: (110.01, 109.12, 5),
+        120: (119.99, 119.10, 5),
     }
 
     @property
@@ -932,8 +1082,6 @@ class PlasticBottleThread(Solid):
     ):
         self.size = size
         self.external = external
-        if hand not in ["right", "left"]:
-            raise ValueError(f'hand must be one of "right" or "left" not {hand}')
         self.hand = hand
         size_match = re.match(r"([LM])(\d+)SP(\d+)", size)
         if not size_match:
@@ -944,7 +1092,7 @@ class PlasticBottleThread(Solid):
         self.style = size_match.group(1)
         self.diameter = int(size_match.group(2))
         self.finish = int(size_match.group(3))
-        if self.finish not in PlasticBottleThread.finish_data.keys():
+        if self.finish not in PlasticBottleThread.finish_data:
             raise ValueError(
                 f"finish ({self.finish}) invalid, must be one of"
                 f" {list(PlasticBottleThread.finish_data.keys())}"
@@ -952,7 +1100,7 @@ class PlasticBottleThread(Solid):
         if not self.diameter in PlasticBottleThread.finish_data[self.finish][1]:
             raise ValueError(
                 f"diameter ({self.diameter}) invalid, must be one"
-                f" of {PlasticBottleThread.finish_data[self.finish][1]}"
+                f" of {list(PlasticBottleThread.finish_data[self.finish][1])}"
             )
         (diameter_max, diameter_min, self.tpi) = PlasticBottleThread.thread_dimensions[
             self.diameter
@@ -980,7 +1128,10 @@ class PlasticBottleThread(Solid):
         self.thread_angles = PlasticBottleThread.thread_angles[
             self.style + str(self.finish)
         ]
-        shoulders = [thread_height * tan(radians(a)) for a in self.thread_angles]
+        shoulders = [
+            thread_height * PlasticBottleThread.thread_angle_tangents[a]
+            for a in self.thread_angles
+        ]
         self.apex_width = self.root_width - sum(shoulders)
         self.apex_offset = shoulders[0] + self.apex_width / 2 - self.root_width / 2
         if not self.external:
@@ -25,7 +25,10 @@ license:
     limitations under the License.
 
 """
+import pickle
 import unittest
+from unittest.mock import patch
+from multiprocessing.reduction import ForkingPickler
 import cadquery as cq
 from cq_warehouse.fastener import *
 import cq_warehouse.extensions
@@ -50,8 +53,29 @@ class TestRecessExceptions(unittest.TestCase):
             (1.25 * IN, IN / 32), decode_imperial_size("1 1/4-32"), 5
         )
 
+    def test_decode_thread_size(self):
+        self.assertTupleAlmostEquals((6, 1), decode_thread_size("M6-1"), 5)
+        self.assertTupleAlmostEquals(
+            (0.25 * IN, IN / 20), decode_thread_size("1/4-20"), 5
+        )
+
+    def test_polygon_diagonal(self):
+        self.assertAlmostEqual(polygon_diagonal(10), 20 / 3**0.5, 5)
+        self.assertAlmostEqual(polygon_diagonal(10, 4), 10 * 2**0.5, 5)
+
+    def test_csv_read_once(self):
+        self.assertIs(
+            read_fastener_parameters_from_csv("clearance_hole_sizes.csv"),
+            read_fastener_parameters_from_csv("clearance_hole_sizes.csv"),
+        )
+        self.assertIs(read_drill_sizes(), read_drill_sizes())
+
     def test_metric_str_to_float(self):
         self.assertEqual(metric_str_to_float(" 1000 "), 1000)
+        self.assertAlmostEqual(metric_str_to_float("0.7"), 0.7, 7)
+        self.assertAlmostEqual(metric_str_to_float("1/2"), 0.5, 7)
+        self.assertTrue(isinstance(metric_str_to_float("10"), int))
+        self.assertTrue(isinstance(metric_str_to_float("10.0"), float))
         self.assertEqual(metric_str_to_float("rm -rf *"), "rm -rf *")
 
 
@@ -77,6 +101,39 @@ class TestWashers(unittest.TestCase):
             occt = washer.cq_object
             self.assertTrue(isinstance(occt, Solid))
 
+    def test_cache(self):
+        """Identical washers share a cached shape but remain distinct objects"""
+        washer = PlainWasher(size="M6", fastener_type="iso7094")
+        washer_copy = PlainWasher(size="M6", fastener_type="iso7094")
+        self.assertFalse(washer.isSame(washer_copy))
+        self.assertAlmostEqual(washer.Volume(), washer_copy.Volume(), 5)
+
+    def test_cache_size(self):
+        """The shape cache discards the least recently used fasteners"""
+        cache_size = cq_warehouse.fastener.FASTENER_CACHE_SIZE
+        cq_warehouse.fastener.FASTENER_CACHE_SIZE = 2
+        try:
+            for size in ["M5", "M6", "M8", "M10"]:
+                PlainWasher(size=size, fastener_type="iso7094")
+            cached_sizes = [key[1] for key in cq_warehouse.fastener._fastener_shapes]
+            self.assertEqual(cached_sizes, ["M8", "M10"])
+        finally:
+            cq_warehouse.fastener.FASTENER_CACHE_SIZE = cache_size
+
+    def test_cache_disabled(self):
+        """Fasteners can still be created when the shape cache size is zero"""
+        with patch.object(cq_warehouse.fastener, "FASTENER_CACHE_SIZE", 0), patch.dict(
+            cq_warehouse.fastener._fastener_shapes, clear=True
+        ):
+            fasteners = [
+                PlainWasher(size="M6", fastener_type="iso7094"),
+                HexNut(size="M6-1", fastener_type="iso4032"),
+                SocketHeadCapScrew(size="M6-1", fastener_type="iso4762", length=20),
+            ]
+            for fastener in fasteners:
+                self.assertTrue(fastener.isValid())
+            self.assertEqual(len(cq_warehouse.fastener._fastener_shapes), 0)
+
     def test_transformation(self):
         washer = PlainWasher(size="M6", fastener_type="iso7094")
         washer_center = washer.Center()
@@ -250,6 +307,31 @@ class TestNuts(unittest.TestCase):
                 )
             self.assertLess(box.Volume(), 999.99)
 
+    def test_cache(self):
+        """Identical nuts share a cached shape but remain distinct objects"""
+        nut = HexNut(size="M6-1", fastener_type="iso4032")
+        nut_copy = HexNut(size="M6-1", fastener_type="iso4032")
+        self.assertFalse(nut.isSame(nut_copy))
+        self.assertAlmostEqual(nut.Volume(), nut_copy.Volume(), 5)
+
+    def test_body_cache(self):
+        """Simple and threaded nuts share a cached body"""
+        with patch.dict(cq_warehouse.fastener._fastener_shapes, clear=True):
+            HexNut(size="M6-1", fastener_type="iso4032")
+            key = ("body", HexNut, "M6-1", "iso4032")
+            self.assertIn(key, cq_warehouse.fastener._fastener_shapes)
+            nut = HexNut(size="M6-1", fastener_type="iso4032", simple=False)
+            self.assertTrue(nut.isValid())
+
+    def test_integer_counts(self):
+        """Counts read from the csv files are integers so these nuts can be built"""
+        heatset = HeatSetNut(size="M3-0.5-Standard", fastener_type="McMaster-Carr")
+        self.assertTrue(isinstance(heatset.nut_data["knurls"], int))
+        self.assertTrue(heatset.isValid())
+        brad_tee = BradTeeNut(size="M6-1", fastener_type="Hilitchi")
+        self.assertTrue(isinstance(brad_tee.nut_data["brad_num"], int))
+        self.assertTrue(brad_tee.isValid())
+
     def test_heatset_fillfactor(self):
         heatset = HeatSetNut(size="M3-0.5-Standard", fastener_type="McMaster-Carr")
         self.assertTrue(isinstance(heatset.fill_factor, float))
@@ -298,6 +380,15 @@ class TestScrews(unittest.TestCase):
             occt = screw.cq_object
             self.assertTrue(isinstance(occt, Solid))
 
+    def test_cache(self):
+        """Identical screws share a cached shape but remain distinct objects"""
+        screw = SocketHeadCapScrew(size="M6-1", fastener_type="iso4762", length=20)
+        screw_copy = SocketHeadCapScrew(size="M6-1", fastener_type="iso4762", length=20)
+        self.assertFalse(screw.isSame(screw_copy))
+        self.assertAlmostEqual(screw.Volume(), screw_copy.Volume(), 5)
+        self.assertAlmostEqual(screw.head_height, screw_copy.head_height, 5)
+        self.assertAlmostEqual(screw.head_diameter, screw_copy.head_diameter, 5)
+
     def test_screw_shorter_then_head(self):
         """Validate check for countersunk screws too short for their head"""
         with self.assertRaises(ValueError):
@@ -437,5 +528,39 @@ class TestScrews(unittest.TestCase):
                 self.assertLess(len(simple_screw.Edges()), len(screw.Edges()))
 
 
+class TestMultiprocessing(unittest.TestCase):
+    """Test transferring fasteners between processes"""
+
+    def test_pickle(self):
+        screw = SocketHeadCapScrew(size="M6-1", fastener_type="iso4762", length=20)
+        screw_copy = pickle.loads(ForkingPickler.dumps(screw))
+        self.assertTrue(isinstance(screw_copy, SocketHeadCapScrew))
+        self.assertEqual(screw.info, screw_copy.info)
+        self.assertAlmostEqual(screw.Volume(), screw_copy.Volume(), 5)
+
+    def test_make_fasteners(self):
+        fasteners = make_fasteners(
+            [
+                (HexNut, {"size": "M6-1", "fastener_type": "iso4032"}),
+                (PlainWasher, {"size": "M6", "fastener_type": "iso7094"}),
+            ],
+            processes=2,
+        )
+        self.assertTrue(isinstance(fasteners[0], HexNut))
+        self.assertTrue(isinstance(fasteners[1], PlainWasher))
+        self.assertTrue(all(f.isValid() for f in fasteners))
+
+    def test_make_fasteners_repeated(self):
+        nut_parameters = {"size": "M6-1", "fastener_type": "iso4032"}
+        fasteners = make_fasteners(
+            [(HexNut, nut_parameters), (HexNut, dict(nut_parameters))], processes=2
+        )
+        self.assertEqual(len(fasteners), 2)
+        self.assertFalse(fasteners[0].isSame(fasteners[1]))
+        self.assertEqual(fasteners[0].info, fasteners[1].info)
+        self.assertAlmostEqual(fasteners[0].Volume(), fasteners[1].Volume(), 5)
+        self.assertIsNot(fasteners[0].nut_data, fasteners[1].nut_data)
+
+
 if __name__ == "__main__":
     unittest.main(failfast=True)
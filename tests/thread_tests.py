@@ -25,8 +25,12 @@ license:
     limitations under the License.
 
 """
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 from cq_warehouse.thread import *
+import cq_warehouse.thread
 import cq_warehouse.extensions
 from OCP.TopoDS import TopoDS_Shape
 
@@ -41,6 +45,9 @@ class TestSupportFunctions(unittest.TestCase):
 
     def test_imperial_str_to_float(self):
         self.assertAlmostEqual(imperial_str_to_float("1 1/2"), 1.5 * IN)
+        self.assertAlmostEqual(imperial_str_to_float(" 3/8 "), 0.375 * IN)
+        self.assertAlmostEqual(imperial_str_to_float("0.25"), 0.25 * IN)
+        self.assertAlmostEqual(imperial_str_to_float("2"), 2 * IN)
         self.assertEqual(imperial_str_to_float("rm -rf *"), "rm -rf *")
 
 
@@ -56,6 +63,169 @@ class TestThread(unittest.TestCase):
                 length=20,
                 end_finishes=("not", "supported"),
             )
+        with self.assertRaises(ValueError):
+            Thread(
+                apex_radius=10,
+                apex_width=2,
+                root_radius=8,
+                root_width=3,
+                pitch=2,
+                length=20,
+                hand="righty",
+            )
+
+    def test_memory_cache(self):
+        parameters = dict(
+            apex_radius=10,
+            apex_width=2,
+            root_radius=8,
+            root_width=3,
+            pitch=2,
+            length=20,
+        )
+        thread = Thread(**parameters)
+        thread_copy = Thread(**parameters)
+        self.assertFalse(thread.isSame(thread_copy))
+        self.assertAlmostEqual(thread.Volume(), thread_copy.Volume(), 5)
+
+    def test_cache_disabled(self):
+        with patch.object(cq_warehouse.thread, "THREAD_CACHE_SIZE", 0), patch.dict(
+            cq_warehouse.thread._thread_shapes, clear=True
+        ):
+            thread = Thread(
+                apex_radius=10,
+                apex_width=2,
+                root_radius=8,
+                root_width=3,
+                pitch=2,
+                length=20,
+            )
+            self.assertTrue(thread.isValid())
+            self.assertEqual(len(cq_warehouse.thread._thread_shapes), 0)
+
+    def test_helix_cache_size(self):
+        with patch.object(cq_warehouse.thread, "THREAD_CACHE_SIZE", 2), patch.dict(
+            cq_warehouse.thread._thread_shapes, clear=True
+        ), patch.dict(cq_warehouse.thread._helix_wires, clear=True):
+            for length in [10, 20, 30]:
+                Thread(
+                    apex_radius=10,
+                    apex_width=2,
+                    root_radius=8,
+                    root_width=3,
+                    pitch=2,
+                    length=length,
+                    end_finishes=("raw", "raw"),
+                )
+            self.assertEqual(len(cq_warehouse.thread._helix_wires), 2)
+
+    def test_fade_cache_size(self):
+        with patch.object(cq_warehouse.thread, "THREAD_CACHE_SIZE", 1), patch.dict(
+            cq_warehouse.thread._thread_shapes, clear=True
+        ), patch.dict(cq_warehouse.thread._fade_faces, clear=True):
+            for pitch in [1, 2]:
+                thread = Thread(
+                    apex_radius=10,
+                    apex_width=pitch / 4,
+                    root_radius=8,
+                    root_width=pitch / 2,
+                    pitch=pitch,
+                    length=20,
+                    end_finishes=("fade", "fade"),
+                )
+                self.assertTrue(thread.isValid())
+            self.assertEqual(len(cq_warehouse.thread._fade_faces), 1)
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as home:
+            with patch.dict(
+                os.environ, {"HOME": home, "CQ_WAREHOUSE_CACHE": "1"}
+            ), patch.dict(cq_warehouse.thread._thread_shapes, clear=True):
+                parameters = dict(
+                    apex_radius=10,
+                    apex_width=2,
+                    root_radius=8,
+                    root_width=3,
+                    pitch=2,
+                    length=20,
+                )
+                thread = Thread(**parameters)
+                cache_dir = os.path.join(home, ".cache", "cq_warehouse", "threads")
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+                # Force the thread to be read back from the disk cache
+                cq_warehouse.thread._thread_shapes.clear()
+                with patch.object(
+                    Thread, "make_thread", side_effect=AssertionError("rebuilt")
+                ):
+                    cached_thread = Thread(**parameters)
+                self.assertTrue(cached_thread.isValid())
+                self.assertAlmostEqual(thread.Volume(), cached_thread.Volume(), 5)
+
+    def test_corrupt_disk_cache(self):
+        parameters = dict(
+            apex_radius=10,
+            apex_width=2,
+            root_radius=8,
+            root_width=3,
+            pitch=2,
+            length=20,
+        )
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.dict(
+                os.environ,
+                {"CQ_WAREHOUSE_CACHE": "1", "CQ_WAREHOUSE_CACHE_DIR": cache_dir},
+            ), patch.dict(cq_warehouse.thread._thread_shapes, clear=True):
+                Thread(**parameters)
+                (cache_file,) = os.listdir(cache_dir)
+                cache_file = os.path.join(cache_dir, cache_file)
+                with open(cache_file, "rb") as brep:
+                    contents = brep.read()
+                for corrupt_contents in [
+                    b"not a brep file",
+                    contents[: len(contents) // 2],
+                ]:
+                    with self.subTest(corrupt_contents=corrupt_contents[:20]):
+                        with open(cache_file, "wb") as corrupt:
+                            corrupt.write(corrupt_contents)
+                        cq_warehouse.thread._thread_shapes.clear()
+                        self.assertTrue(Thread(**parameters).isValid())
+                        # The unreadable file is replaced by a good one
+                        cq_warehouse.thread._thread_shapes.clear()
+                        with patch.object(
+                            Thread, "make_thread", side_effect=AssertionError("rebuilt")
+                        ):
+                            self.assertTrue(Thread(**parameters).isValid())
+
+    def test_unwritable_disk_cache(self):
+        with tempfile.TemporaryDirectory() as home:
+            # A file where the cache directory should be can't be written to
+            not_a_dir = os.path.join(home, "cache")
+            with open(not_a_dir, "w") as blocker:
+                blocker.write("")
+            with patch.dict(
+                os.environ,
+                {"CQ_WAREHOUSE_CACHE": "1", "CQ_WAREHOUSE_CACHE_DIR": not_a_dir},
+            ), patch.dict(cq_warehouse.thread._thread_shapes, clear=True):
+                thread = Thread(
+                    apex_radius=10,
+                    apex_width=2,
+                    root_radius=8,
+                    root_width=3,
+                    pitch=2,
+                    length=20,
+                )
+                self.assertTrue(thread.isValid())
+            self.assertEqual(os.listdir(home), ["cache"])
+
+    def test_disk_cache_dir(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.dict(
+                os.environ,
+                {"CQ_WAREHOUSE_CACHE": "1", "CQ_WAREHOUSE_CACHE_DIR": cache_dir},
+            ):
+                cache_file = thread_cache_file(("Thread", 10, 2, 8, 3, 2, 20))
+                self.assertEqual(os.path.dirname(cache_file), cache_dir)
+            self.assertIsNone(thread_cache_file(("Thread", 10, 2, 8, 3, 2, 20)))
 
     def test_deprecation(self):
         thread = Thread(
@@ -106,6 +276,18 @@ class TestIsoThread(unittest.TestCase):
                     )
                     self.assertTrue(thread.isValid())
 
+    def test_square_ends(self):
+        """Both squared ends are clipped to the thread length"""
+        thread = IsoThread(
+            major_diameter=6 * MM,
+            pitch=1 * MM,
+            length=8 * MM,
+            end_finishes=("square", "square"),
+        )
+        bbox = thread.BoundingBox()
+        self.assertAlmostEqual(bbox.zmin, 0, 5)
+        self.assertAlmostEqual(bbox.zmax, 8 * MM, 5)
+
     def test_parsing(self):
 
         with self.assertRaises(ValueError):
@@ -127,6 +309,14 @@ class TestIsoThread(unittest.TestCase):
         )
         self.assertTrue(thread.wrapped.IsNull())
 
+    def test_calculate_min_radius(self):
+        thread = IsoThread(
+            major_diameter=6 * MM, pitch=1 * MM, length=8 * MM, simple=True
+        )
+        self.assertAlmostEqual(
+            IsoThread.calculate_min_radius(6 * MM, 1 * MM), thread.min_radius, 5
+        )
+
 
 class TestAcmeThread(unittest.TestCase):
     def test_exterior_thread(self):